@@ -3,8 +3,10 @@
 import os
 import sys
 import json
+import functools
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.ticker import PercentFormatter
 import seaborn as sns
 from datetime import datetime
 from pathlib import Path
@@ -19,6 +21,7 @@ from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
+from PIL import Image as PILImage
 import numpy as np
 from tabulate import tabulate
 
@@ -95,18 +98,23 @@ def find_latest_files(output_dir, currency, date=None):
             'timestamp': None
         }
 
-def load_data(file_paths):
-    """Load data from CSV files."""
+@functools.lru_cache(maxsize=None)
+def read_output_csv(path):
+    """Read a timestamped CSV written by main.py once; the shared result must not be modified."""
+    return pd.read_csv(path)
+
+def load_data(file_paths, fields=None):
+    """Load data from CSV files, optionally restricted to the given fields."""
     data = {}
     
-    if file_paths['summary'] and os.path.exists(file_paths['summary']):
-        data['summary'] = pd.read_csv(file_paths['summary'])
-    
-    if file_paths['high_volume'] and os.path.exists(file_paths['high_volume']):
-        data['high_volume'] = pd.read_csv(file_paths['high_volume'])
-    
-    if file_paths['put_call'] and os.path.exists(file_paths['put_call']):
-        data['put_call'] = pd.read_csv(file_paths['put_call'])
+    for key in ('summary', 'high_volume', 'put_call'):
+        # Skip files the caller does not need so they are never read
+        if fields is not None and key not in fields:
+            continue
+        
+        path = file_paths[key]
+        if path and os.path.exists(path):
+            data[key] = read_output_csv(path)
     
     return data
 
@@ -264,7 +272,7 @@ def create_comparison_plots(btc_data, eth_data, output_dir):
             ax.legend()
             
             # Format y-axis as percentage
-            ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda y, _: f'{y:.1%}'))
+            ax.yaxis.set_major_formatter(PercentFormatter(xmax=1.0, decimals=1))
             
             # Add value labels on bars
             def autolabel(rects):
@@ -566,7 +574,7 @@ def calculate_skew_metrics(currency, output_dir):
             'term_slope': 0.0
         }
     
-    df = pd.read_csv(vol_file)
+    df = read_output_csv(vol_file)
     
     # Calculate ATM volatility (using closest to current price)
     current_price = get_current_price(currency, output_dir)
@@ -588,9 +596,9 @@ def calculate_skew_metrics(currency, output_dir):
     skew_10d = otm_10d_puts - otm_10d_calls if not (np.isnan(otm_10d_puts) or np.isnan(otm_10d_calls)) else 0.0
     
     # Calculate term structure slope
-    df['days_to_expiry'] = pd.to_numeric(df['days_to_expiration'])
-    near_term = df[df['days_to_expiry'] <= 30]['implied_volatility'].mean()
-    far_term = df[df['days_to_expiry'] > 180]['implied_volatility'].mean()
+    days_to_expiry = pd.to_numeric(df['days_to_expiration'])
+    near_term = df[days_to_expiry <= 30]['implied_volatility'].mean()
+    far_term = df[days_to_expiry > 180]['implied_volatility'].mean()
     term_slope = (far_term - near_term) / near_term * 100 if not (np.isnan(near_term) or np.isnan(far_term)) else 0.0
     
     return {
@@ -606,7 +614,7 @@ def get_current_price(currency, output_dir):
     stats_file = os.path.join(output_dir, f'{currency}_summary_stats_{timestamp}.csv')
     
     if os.path.exists(stats_file):
-        df = pd.read_csv(stats_file)
+        df = read_output_csv(stats_file)
         if 'current_price' in df.columns:
             return float(df['current_price'].iloc[0])
     return 0.0
@@ -641,7 +649,7 @@ def analyze_volatility_hotspots(currency, output_dir):
             'active_strikes': []
         }
     
-    df = pd.read_csv(hotspots_file)
+    df = read_output_csv(hotspots_file)
     
     # Calculate metrics
     total = len(df)
@@ -704,6 +712,13 @@ def generate_pdf_report(md_file, plot_files, output_dir):
     
     normal_style = styles['Normal']
     
+    # Heading styles by number of leading '#' characters
+    heading_styles = {
+        1: title_style,
+        2: heading1_style,
+        3: heading2_style
+    }
+    
     # Parse the markdown content
     lines = md_content.split('\n')
     
@@ -715,21 +730,23 @@ def generate_pdf_report(md_file, plot_files, output_dir):
     while i < len(lines):
         line = lines[i].strip()
         
-        # Title (# Heading)
-        if line.startswith('# '):
-            elements.append(Paragraph(line[2:], title_style))
-            elements.append(Spacer(1, 0.2 * inch))
+        # Dispatch on the first character rather than testing each prefix in turn
+        first = line[:1]
         
-        # Heading 1 (## Heading)
-        elif line.startswith('## '):
-            elements.append(Paragraph(line[3:], heading1_style))
+        heading_style = None
+        if first == '#':
+            level = len(line) - len(line.lstrip('#'))
+            if line[level:level + 1] == ' ':
+                heading_style = heading_styles.get(level)
         
-        # Heading 2 (### Heading)
-        elif line.startswith('### '):
-            elements.append(Paragraph(line[4:], heading2_style))
+        # Title (# Heading), Heading 1 (## Heading), Heading 2 (### Heading)
+        if heading_style is not None:
+            elements.append(Paragraph(line[level + 1:], heading_style))
+            if level == 1:
+                elements.append(Spacer(1, 0.2 * inch))
         
         # Table
-        elif line.startswith('|'):
+        elif first == '|':
             # Find the end of the table
             table_lines = []
             while i < len(lines) and lines[i].strip().startswith('|'):
@@ -763,7 +780,7 @@ def generate_pdf_report(md_file, plot_files, output_dir):
                     elements.append(Spacer(1, 0.2 * inch))
         
         # Image
-        elif line.startswith('!['):
+        elif first == '!' and line[1:2] == '[':
             try:
                 # Extract image path and description
                 img_desc = line[2:].split(']')[0]
@@ -797,25 +814,24 @@ def generate_pdf_report(md_file, plot_files, output_dir):
                     elements.append(Paragraph(img_desc, styles['Italic']))
                     elements.append(Spacer(1, 0.1 * inch))
                     
-                    # Add image with proper scaling
-                    img = Image(actual_path)
-                    
-                    # Get the available width (accounting for margins)
-                    available_width = doc.width
+                    # Read the image dimensions from the file header only,
+                    # without decoding the pixel data
+                    with PILImage.open(actual_path) as pil_img:
+                        image_width, image_height = pil_img.size
+                    aspect = image_height / image_width
                     
-                    # Calculate scaling factor to fit width while maintaining aspect ratio
-                    scale_factor = available_width / img.imageWidth
-                    
-                    # Set new dimensions
-                    img.drawWidth = img.imageWidth * scale_factor
-                    img.drawHeight = img.imageHeight * scale_factor
+                    # Scale to fit the available width while maintaining aspect ratio
+                    draw_width = doc.width
+                    draw_height = draw_width * aspect
                     
                     # If height is too large, scale down further
                     max_height = doc.height * 0.75  # Use 75% of page height as maximum
-                    if img.drawHeight > max_height:
-                        height_scale = max_height / img.drawHeight
-                        img.drawWidth *= height_scale
-                        img.drawHeight = max_height
+                    if draw_height > max_height:
+                        draw_width *= max_height / draw_height
+                        draw_height = max_height
+                    
+                    # Pass the sizes up front so ReportLab does not probe the image
+                    img = Image(actual_path, width=draw_width, height=draw_height)
                     
                     elements.append(img)
                     elements.append(Spacer(1, 0.3 * inch))
@@ -825,7 +841,7 @@ def generate_pdf_report(md_file, plot_files, output_dir):
                 print(f"Warning: Failed to process image {img_path}: {str(e)}")
         
         # Normal paragraph
-        elif line and not line.startswith('---'):
+        elif first and line[:3] != '---':
             elements.append(Paragraph(line, normal_style))
             elements.append(Spacer(1, 0.1 * inch))
         
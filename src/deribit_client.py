@@ -2,12 +2,18 @@ import os
 import json
 import time
 import requests
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+class DeribitAPIError(requests.HTTPError):
+    """
+    Error returned by the Deribit API, either as an HTTP error status or in the response body.
+    """
+
+
 class DeribitClient:
     """
     Client for interacting with the Deribit API to fetch options data.
@@ -15,6 +21,9 @@ class DeribitClient:
     
     BASE_URL = "https://www.deribit.com/api/v2"
     
+    # Seconds for which a fetched index price is reused
+    INDEX_PRICE_TTL = 5.0
+    
     def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
         """
         Initialize the Deribit API client.
@@ -26,6 +35,18 @@ class DeribitClient:
         self.api_key = api_key or os.getenv("DERIBIT_API_KEY")
         self.api_secret = api_secret or os.getenv("DERIBIT_API_SECRET")
         self.session = requests.Session()
+        
+        # Request headers are the same for every call, so build them once
+        self._headers = {
+            "Content-Type": "application/json",
+        }
+        
+        # Add authentication if API key is available
+        if self.api_key:
+            self._headers["Authorization"] = f"Bearer {self.api_key}"
+        
+        # Cache of index prices by currency: (monotonic fetch time, result)
+        self._index_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
     
     def _make_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -37,28 +58,29 @@ class DeribitClient:
             
         Returns:
             API response as a dictionary
+            
+        Raises:
+            DeribitAPIError: If the request fails or the API returns an error
         """
         url = f"{self.BASE_URL}/public/{method}"
         
-        headers = {
-            "Content-Type": "application/json",
-        }
+        response = self.session.get(url, params=params, headers=self._headers)
         
-        # Add authentication if API key is available
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        
-        response = self.session.get(url, params=params, headers=headers)
-        
-        if response.status_code != 200:
-            raise Exception(f"API request failed with status {response.status_code}: {response.text}")
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as e:
+            raise DeribitAPIError(
+                f"API request failed with status {response.status_code}: {response.text}",
+                response=response
+            ) from e
         
         result = response.json()
         
-        if "error" in result and result["error"]:
-            raise Exception(f"API error: {result['error']}")
+        error = result.get("error")
+        if error:
+            raise DeribitAPIError(f"API error: {error}", response=response)
         
-        return result["result"] if "result" in result else result
+        return result.get("result", result)
     
     def get_instruments(self, currency: str, kind: str = "option", expired: bool = False) -> List[Dict[str, Any]]:
         """
@@ -116,17 +138,26 @@ class DeribitClient:
         """
         Get current index price for a currency.
         
+        Results are cached for INDEX_PRICE_TTL seconds.
+        
         Args:
             currency: Currency code (BTC or ETH)
             
         Returns:
             Index price data
         """
+        fetched_at, result = self._index_cache.get(currency, (0.0, None))
+        if result is not None and time.monotonic() - fetched_at < self.INDEX_PRICE_TTL:
+            return result
+        
         params = {
             "index_name": f"{currency.lower()}_usd"
         }
         
-        return self._make_request("get_index_price", params)
+        result = self._make_request("get_index_price", params)
+        self._index_cache[currency] = (time.monotonic(), result)
+        
+        return result
     
     def get_option_instruments_by_currency(self, currency: str) -> List[Dict[str, Any]]:
         """
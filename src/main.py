@@ -2,9 +2,12 @@
 
 import os
 import sys
+import csv
 import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
@@ -45,6 +48,13 @@ def parse_arguments():
         help="Directory to save output files"
     )
     
+    parser.add_argument(
+        "--cache-dir", 
+        type=str, 
+        default=None,
+        help="Directory for snapshots of fetched options data, reused for a few minutes (disabled by default)"
+    )
+    
     return parser.parse_args()
 
 
@@ -55,10 +65,8 @@ def ensure_output_dir(output_dir):
     return path
 
 
-def save_summary_to_csv(summary, output_path):
+def save_summary_to_csv(summary, output_path, timestamp):
     """Save the summary data to CSV files."""
-    # Create a timestamp for the filenames
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     currency = summary["currency"]
     
     # Save open interest data
@@ -110,30 +118,32 @@ def save_summary_to_csv(summary, output_path):
         "max_iv": summary["implied_volatility_summary"]["max_iv"]
     }
     
-    stats_df = pd.DataFrame([stats])
+    # Single row, so write it directly rather than going through a DataFrame
     stats_file = output_path / f"{currency}_summary_stats_{timestamp}.csv"
-    stats_df.to_csv(stats_file, index=False)
+    with open(stats_file, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(stats), lineterminator="\n")
+        writer.writeheader()
+        writer.writerow(stats)
     print(f"Saved summary statistics to {stats_file}")
     
     # Save put/call ratio by expiration
     pc_by_expiry = summary["open_interest_analysis"]["put_call_by_expiry"]
-    pc_data = [{"expiration_date": date, "put_call_ratio": ratio} for date, ratio in pc_by_expiry.items()]
-    pc_df = pd.DataFrame(pc_data)
+    pc_df = pd.DataFrame({
+        "expiration_date": list(pc_by_expiry),
+        "put_call_ratio": list(pc_by_expiry.values())
+    })
     pc_file = output_path / f"{currency}_put_call_by_expiry_{timestamp}.csv"
     pc_df.to_csv(pc_file, index=False)
     print(f"Saved put/call ratio by expiration to {pc_file}")
     
     # Save high volume strikes data
     high_vol_strikes = summary["open_interest_analysis"]["high_volume_strikes"]
-    high_vol_data = [
-        {
-            "strike": strike,
-            "volume": data["volume"],
-            "distance_pct": data["distance_pct"]
-        }
-        for strike, data in high_vol_strikes.items()
-    ]
-    high_vol_df = pd.DataFrame(high_vol_data)
+    count = len(high_vol_strikes)
+    high_vol_df = pd.DataFrame({
+        "strike": np.fromiter(high_vol_strikes.keys(), dtype=np.float64, count=count),
+        "volume": np.fromiter((data["volume"] for data in high_vol_strikes.values()), dtype=np.float64, count=count),
+        "distance_pct": np.fromiter((data["distance_pct"] for data in high_vol_strikes.values()), dtype=np.float64, count=count)
+    })
     high_vol_file = output_path / f"{currency}_high_volume_strikes_{timestamp}.csv"
     high_vol_df.to_csv(high_vol_file, index=False)
     print(f"Saved high volume strikes data to {high_vol_file}")
@@ -158,28 +168,70 @@ def save_summary_to_csv(summary, output_path):
         print(f"Saved {segment_key} segment data to {segment_file}")
 
 
-def save_summary_to_json(summary, output_path):
+def save_summary_to_json(summary, output_path, timestamp):
     """Save the summary data to a JSON file."""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     currency = summary["currency"]
     
     json_file = output_path / f"{currency}_options_summary_{timestamp}.json"
     
+    # Encode in one call and write once, rather than streaming many small chunks to the file
     with open(json_file, "w") as f:
-        json.dump(summary, f, indent=2)
+        f.write(json.dumps(summary, indent=2))
     
     print(f"Saved summary data to {json_file}")
 
 
+# Independent plots rendered in worker processes: (analyzer method, filename suffix, description)
+PLOTS = [
+    ("plot_open_interest_distribution", "open_interest_distribution", "open interest plot"),
+    ("plot_implied_volatility_smile", "implied_volatility_smile", "implied volatility plot"),
+    ("plot_open_interest_heatmap", "open_interest_heatmap", "open interest heatmap"),
+    ("plot_segmented_open_interest", "segmented_open_interest", "segmented open interest plot"),
+    ("plot_volatility_surface", "volatility_surface", "volatility surface plot"),
+]
+
+
+def init_plot_worker():
+    """Use a non-interactive matplotlib backend in plot worker processes."""
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def render_plot(data, method_name, save_path):
+    """Render a single analyzer plot from already fetched options data."""
+    analyzer = OptionsAnalyzer(client=None)
+    analyzer.data = data
+    getattr(analyzer, method_name)(save_path=save_path)
+    return save_path
+
+
+def generate_plots(data, output_path, currency, timestamp):
+    """Render all plots in parallel, one process per plot."""
+    print("Generating plots...")
+    max_workers = min(len(PLOTS), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=init_plot_worker) as executor:
+        futures = {}
+        for method_name, suffix, description in PLOTS:
+            plot_path = output_path / f"{currency}_{suffix}_{timestamp}.png"
+            futures[executor.submit(render_plot, data, method_name, plot_path)] = description
+        
+        for future in as_completed(futures):
+            plot_path = future.result()
+            print(f"Saved {futures[future]} to {plot_path}")
+
+
 def main():
     """Main function to run the options chain aggregator."""
     args = parse_arguments()
     
+    # Use a single timestamp so all files from this run share the same suffix
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
     # Create the Deribit client
     client = DeribitClient()
     
     # Create the options analyzer
-    analyzer = OptionsAnalyzer(client)
+    analyzer = OptionsAnalyzer(client, cache_dir=args.cache_dir)
     
     try:
         # Fetch options data
@@ -190,53 +242,24 @@ def main():
         print("Generating options summary...")
         summary = analyzer.generate_daily_summary()
         
+        # Ensure output directory exists if anything will be written to it
+        if args.output != "console" or args.plot:
+            output_path = ensure_output_dir(args.output_dir)
+        
         # Output the summary based on the specified format
         if args.output == "console":
             analyzer.print_summary(summary)
-        else:
-            # Ensure output directory exists
-            output_path = ensure_output_dir(args.output_dir)
-            
-            if args.output == "csv":
-                save_summary_to_csv(summary, output_path)
-            elif args.output == "json":
-                save_summary_to_json(summary, output_path)
+        elif args.output == "csv":
+            save_summary_to_csv(summary, output_path, timestamp)
+        elif args.output == "json":
+            save_summary_to_json(summary, output_path, timestamp)
         
         # Generate plots if requested
         if args.plot:
-            output_path = ensure_output_dir(args.output_dir)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             currency = args.currency
             
-            # Plot open interest distribution
-            oi_plot_path = output_path / f"{currency}_open_interest_distribution_{timestamp}.png"
-            print(f"Generating open interest distribution plot...")
-            analyzer.plot_open_interest_distribution(save_path=oi_plot_path)
-            print(f"Saved open interest plot to {oi_plot_path}")
-            
-            # Plot implied volatility smile
-            iv_plot_path = output_path / f"{currency}_implied_volatility_smile_{timestamp}.png"
-            print(f"Generating implied volatility smile plot...")
-            analyzer.plot_implied_volatility_smile(save_path=iv_plot_path)
-            print(f"Saved implied volatility plot to {iv_plot_path}")
-            
-            # Plot open interest heatmap
-            heatmap_path = output_path / f"{currency}_open_interest_heatmap_{timestamp}.png"
-            print(f"Generating open interest heatmap...")
-            analyzer.plot_open_interest_heatmap(save_path=heatmap_path)
-            print(f"Saved open interest heatmap to {heatmap_path}")
-            
-            # Plot segmented open interest
-            segment_path = output_path / f"{currency}_segmented_open_interest_{timestamp}.png"
-            print(f"Generating segmented open interest plot...")
-            analyzer.plot_segmented_open_interest(save_path=segment_path)
-            print(f"Saved segmented open interest plot to {segment_path}")
-            
-            # Plot volatility surface
-            vol_surface_path = output_path / f"{currency}_volatility_surface_{timestamp}.png"
-            print(f"Generating volatility surface plot...")
-            analyzer.plot_volatility_surface(save_path=vol_surface_path)
-            print(f"Saved volatility surface plot to {vol_surface_path}")
+            # Render the plots in parallel
+            generate_plots(analyzer.data, output_path, currency, timestamp)
             
             # Analyze volatility skew hotspots
             print(f"Analyzing volatility skew hotspots...")
@@ -1,10 +1,12 @@
+import functools
+import json
+import sys
+import time
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional, Tuple
-import matplotlib.pyplot as plt
-from tabulate import tabulate
-import seaborn as sns
+from pathlib import Path
 
 from deribit_client import DeribitClient
 
@@ -14,38 +16,108 @@ class OptionsAnalyzer:
     Analyzer for processing and analyzing options data from Deribit.
     """
     
-    def __init__(self, client: DeribitClient):
+    OPTION_TYPE_DTYPE = pd.CategoricalDtype(["call", "put", "unknown"])
+    
+    # Length in seconds of the time window a data snapshot is reused for
+    SNAPSHOT_BUCKET_SECONDS = 300
+    
+    # Expirations with a mean implied volatility below this are skipped when looking for hotspots
+    MIN_MEAN_IV = 1e-6
+    
+    # Tick label format for strike price axes (a str.format spec for StrMethodFormatter)
+    STRIKE_TICK_FORMAT = "${x:,.0f}"
+    
+    # Decimal places shown on implied volatility percentage axes
+    IV_TICK_DECIMALS = 1
+    
+    def __init__(self, client: DeribitClient, cache_dir: Optional[str] = None):
         """
         Initialize the options analyzer.
         
         Args:
             client: DeribitClient instance for API interactions
+            cache_dir: Directory for snapshots of fetched data (optional, disabled if not provided)
         """
         self.client = client
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        
+        # DataFrame and calls/puts split built from self.data, reset whenever it is replaced
+        self._df_cache = None
+        self._calls_puts_cache = None
         self.data = {}
     
-    def _timestamp_to_date(self, timestamp: int) -> str:
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Options data as built by fetch_options_data."""
+        return self._data
+    
+    @data.setter
+    def data(self, data: Dict[str, Any]) -> None:
+        # Anything derived from the previous data is stale
+        self._data = data
+        self._df_cache = None
+        self._calls_puts_cache = None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _timestamp_to_date(timestamp: int) -> str:
         """
         Convert a Unix timestamp to a human-readable date string.
         
+        Results are memoized, since many options share the same expiration timestamp.
+        
         Args:
             timestamp: Unix timestamp in milliseconds
             
         Returns:
-            Date string in YYYY-MM-DD format
+            Date string in YYYY-MM-DD format (UTC)
+        """
+        return datetime.fromtimestamp(timestamp / 1000, tz=timezone.utc).strftime('%Y-%m-%d')
+    
+    def _timestamps_to_dates(self, timestamps: pd.Series) -> pd.Categorical:
+        """
+        Convert a column of Unix timestamps to dictionary-encoded date strings.
+        
+        Many options share the same timestamp, so each distinct value is
+        formatted once and the column is stored as a categorical.
+        
+        Args:
+            timestamps: Unix timestamps in milliseconds
+            
+        Returns:
+            Categorical of dates in YYYY-MM-DD format (UTC), with categories in date order
         """
-        return datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d')
+        codes, unique_timestamps = pd.factorize(timestamps, sort=True)
+        dates = pd.to_datetime(unique_timestamps, unit="ms").strftime("%Y-%m-%d")
+        
+        # Distinct timestamps can fall on the same date
+        date_codes, unique_dates = pd.factorize(dates)
+        
+        return pd.Categorical.from_codes(date_codes[codes], categories=unique_dates)
     
     def fetch_options_data(self, currency: str) -> Dict[str, Any]:
         """
         Fetch all relevant options data for a currency.
         
+        If a cache directory is configured, a snapshot fetched within the same
+        SNAPSHOT_BUCKET_SECONDS window is reused instead of calling the API.
+        
         Args:
             currency: Currency code (BTC or ETH)
             
         Returns:
             Dictionary containing options data
         """
+        snapshot_path = None
+        if self.cache_dir:
+            bucket = int(time.time() // self.SNAPSHOT_BUCKET_SECONDS)
+            snapshot_path = self.cache_dir / f"{currency}_{bucket}.json"
+            
+            if snapshot_path.exists():
+                with open(snapshot_path, "r") as f:
+                    self.data = json.load(f)
+                return self.data
+        
         # Get current index price
         index_price = self.client.get_index_price(currency)
         
@@ -58,55 +130,71 @@ class OptionsAnalyzer:
         # Create a lookup dictionary for summaries by instrument name
         summary_by_name = {s["instrument_name"]: s for s in summaries}
         
-        # Combine instrument data with summary data
+        # Combine instrument data with summary data, with one lookup per instrument
         options_data = []
         for instrument in instruments:
-            instrument_name = instrument["instrument_name"]
-            if instrument_name in summary_by_name:
-                option_data = {**instrument, **summary_by_name[instrument_name]}
-                options_data.append(option_data)
+            summary = summary_by_name.get(instrument["instrument_name"])
+            if summary is not None:
+                options_data.append({**instrument, **summary})
         
         # Store the data
-        self.data = {
+        data = {
             "currency": currency,
             "index_price": index_price["index_price"],
             "timestamp": datetime.now().isoformat(),
             "options": options_data
         }
         
+        if snapshot_path:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(snapshot_path, "w") as f:
+                json.dump(data, f)
+        
+        self.data = data
         return self.data
     
     def create_options_dataframe(self) -> pd.DataFrame:
         """
         Create a pandas DataFrame from the options data.
         
+        The DataFrame is built once per fetch and shared by all callers, so it
+        must not be modified in place.
+        
         Returns:
             DataFrame containing options data
         """
+        if self._df_cache is not None:
+            return self._df_cache
+        
         if not self.data or "options" not in self.data:
             raise ValueError("No options data available. Call fetch_options_data first.")
         
         df = pd.DataFrame(self.data["options"])
         
-        # Extract option type (call/put) from instrument name
-        df["option_type"] = df["instrument_name"].apply(
-            lambda x: "call" if "-C" in x else "put" if "-P" in x else "unknown"
+        # Extract option type (call/put) from instrument name, stored as a categorical
+        instrument_name = df["instrument_name"]
+        option_type_codes = np.where(
+            instrument_name.str.contains("-C", regex=False), 0,
+            np.where(instrument_name.str.contains("-P", regex=False), 1, 2)
         )
+        df["option_type"] = pd.Categorical.from_codes(option_type_codes, dtype=self.OPTION_TYPE_DTYPE)
         
         # Convert timestamps to dates
-        df["expiration_date"] = df["expiration_timestamp"].apply(self._timestamp_to_date)
-        df["creation_date"] = df["creation_timestamp"].apply(self._timestamp_to_date)
+        df["expiration_date"] = self._timestamps_to_dates(df["expiration_timestamp"])
+        df["creation_date"] = self._timestamps_to_dates(df["creation_timestamp"])
         
-        # Calculate days to expiration
+        # Calculate days to expiration (int32 is ample for a day count)
         current_time = datetime.now().timestamp() * 1000
-        df["days_to_expiration"] = df["expiration_timestamp"].apply(
-            lambda x: max(0, round((x - current_time) / (1000 * 60 * 60 * 24)))
-        )
+        days = np.round((df["expiration_timestamp"].to_numpy() - current_time) / (1000 * 60 * 60 * 24))
+        df["days_to_expiration"] = np.maximum(0, days).astype(np.int32)
         
         # Calculate distance from current price (as percentage)
         current_price = self.data["index_price"]
         df["price_distance_pct"] = ((df["strike"] - current_price) / current_price * 100).round(2)
         
+        self._df_cache = df
+        self._calls_puts_cache = None
+        
         return df
     
     def get_expiration_dates(self) -> List[str]:
@@ -116,8 +204,16 @@ class OptionsAnalyzer:
         Returns:
             List of expiration dates
         """
-        df = self.create_options_dataframe()
-        return sorted(df["expiration_date"].unique())
+        if self._df_cache is not None:
+            return sorted(self._df_cache["expiration_date"].unique())
+        
+        if not self.data or "options" not in self.data:
+            raise ValueError("No options data available. Call fetch_options_data first.")
+        
+        # Read the raw options rather than building the full DataFrame; the
+        # date categories come out distinct and in date order
+        timestamps = pd.Series([option["expiration_timestamp"] for option in self.data["options"]], dtype="int64")
+        return self._timestamps_to_dates(timestamps).categories.tolist()
     
     def get_strike_prices(self) -> List[float]:
         """
@@ -126,8 +222,14 @@ class OptionsAnalyzer:
         Returns:
             List of strike prices
         """
-        df = self.create_options_dataframe()
-        return sorted(df["strike"].unique())
+        if self._df_cache is not None:
+            return sorted(self._df_cache["strike"].unique())
+        
+        if not self.data or "options" not in self.data:
+            raise ValueError("No options data available. Call fetch_options_data first.")
+        
+        # Read the raw options rather than building the full DataFrame
+        return sorted({option["strike"] for option in self.data["options"]})
     
     def get_options_by_expiration(self, expiration_date: str) -> pd.DataFrame:
         """
@@ -162,138 +264,170 @@ class OptionsAnalyzer:
         Returns:
             Tuple of (calls_df, puts_df)
         """
-        df = self.create_options_dataframe()
-        calls = df[df["option_type"] == "call"]
-        puts = df[df["option_type"] == "put"]
-        return calls, puts
+        if self._calls_puts_cache is None:
+            df = self.create_options_dataframe()
+            options_by_type = dict(list(df.groupby("option_type", sort=False, observed=True)))
+            calls = options_by_type.get("call", df.iloc[:0])
+            puts = options_by_type.get("put", df.iloc[:0])
+            self._calls_puts_cache = (calls, puts)
+        
+        return self._calls_puts_cache
     
-    def calculate_open_interest_summary(self) -> Dict[str, Any]:
+    def calculate_open_interest_summary(self, df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """
         Calculate summary statistics for open interest.
         
+        Args:
+            df: Options DataFrame (optional, built from the fetched data if not given)
+            
         Returns:
             Dictionary with open interest summary
         """
-        df = self.create_options_dataframe()
-        calls, puts = self.get_calls_and_puts()
+        if df is None:
+            df = self.create_options_dataframe()
         
-        total_oi = df["open_interest"].sum()
-        calls_oi = calls["open_interest"].sum()
-        puts_oi = puts["open_interest"].sum()
+        # Sum open interest by option type in a single pass
+        oi_by_type = df.groupby("option_type", sort=False, observed=True)["open_interest"].sum()
+        total_oi = oi_by_type.sum()
+        calls_oi = oi_by_type.get("call", 0.0)
+        puts_oi = oi_by_type.get("put", 0.0)
         
         # Calculate put/call ratio
         put_call_ratio = puts_oi / calls_oi if calls_oi > 0 else float('inf')
         
         # Get top expirations by open interest
-        expiration_oi = df.groupby("expiration_date")["open_interest"].sum().sort_values(ascending=False)
+        expiration_oi = df.groupby("expiration_date", sort=False, observed=True)["open_interest"].sum().nlargest(5)
         
         # Get top strikes by open interest
-        strike_oi = df.groupby("strike")["open_interest"].sum().sort_values(ascending=False)
+        strike_oi = df.groupby("strike", sort=False)["open_interest"].sum().nlargest(5)
         
         return {
             "total_open_interest": total_oi,
             "calls_open_interest": calls_oi,
             "puts_open_interest": puts_oi,
             "put_call_ratio": put_call_ratio,
-            "top_expirations": expiration_oi.head(5).to_dict(),
-            "top_strikes": strike_oi.head(5).to_dict()
+            "top_expirations": expiration_oi.to_dict(),
+            "top_strikes": strike_oi.to_dict()
         }
     
-    def analyze_open_interest_by_strike_and_expiry(self) -> Dict[str, Any]:
+    def analyze_open_interest_by_strike_and_expiry(self, df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """
         Analyze open interest distribution by strike price and expiration date.
         
+        Args:
+            df: Options DataFrame (optional, built from the fetched data if not given)
+            
+        The open interest tables are returned in long form: parallel lists of
+        expiration dates, strikes and open interest, one entry per combination
+        that has listed options, sorted by expiration date and strike.
+        
         Returns:
             Dictionary with open interest analysis by strike and expiration
         """
-        df = self.create_options_dataframe()
-        calls, puts = self.get_calls_and_puts()
+        if df is None:
+            df = self.create_options_dataframe()
         
         # Get current price
         current_price = self.data["index_price"]
         
+        # Sum open interest once per expiration date, strike and option type
+        oi_by_key = df.groupby(
+            ["expiration_date", "strike", "option_type"], sort=False, observed=True
+        )["open_interest"].sum()
+        option_types = oi_by_key.index.get_level_values("option_type")
+        
         # Group by expiration date and strike
-        oi_by_expiry_strike = df.pivot_table(
-            index="expiration_date", 
-            columns="strike", 
-            values="open_interest", 
-            aggfunc="sum",
-            fill_value=0
-        )
+        oi_by_expiry_strike = oi_by_key.groupby(
+            level=["expiration_date", "strike"], sort=False, observed=True
+        ).sum()
         
-        # Group calls by expiration date and strike
-        calls_oi_by_expiry_strike = calls.pivot_table(
-            index="expiration_date", 
-            columns="strike", 
-            values="open_interest", 
-            aggfunc="sum",
-            fill_value=0
+        # Split calls and puts by expiration date and strike
+        calls_oi_by_expiry_strike = (
+            oi_by_key.xs("call", level="option_type") if "call" in option_types else oi_by_key.iloc[:0]
         )
-        
-        # Group puts by expiration date and strike
-        puts_oi_by_expiry_strike = puts.pivot_table(
-            index="expiration_date", 
-            columns="strike", 
-            values="open_interest", 
-            aggfunc="sum",
-            fill_value=0
+        puts_oi_by_expiry_strike = (
+            oi_by_key.xs("put", level="option_type") if "put" in option_types else oi_by_key.iloc[:0]
         )
         
         # Calculate put/call ratio by expiration date
-        put_call_by_expiry = {}
-        for expiry in df["expiration_date"].unique():
-            expiry_calls = calls[calls["expiration_date"] == expiry]["open_interest"].sum()
-            expiry_puts = puts[puts["expiration_date"] == expiry]["open_interest"].sum()
-            put_call_by_expiry[expiry] = expiry_puts / expiry_calls if expiry_calls > 0 else float('inf')
+        oi_by_expiry_type = (
+            oi_by_key.groupby(level=["expiration_date", "option_type"], sort=False, observed=True).sum()
+            .unstack("option_type", fill_value=0)
+            .reindex(index=df["expiration_date"].unique(), columns=["call", "put"], fill_value=0)
+        )
+        expiry_calls = oi_by_expiry_type["call"].to_numpy()
+        expiry_puts = oi_by_expiry_type["put"].to_numpy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratios = np.where(expiry_calls > 0, expiry_puts / expiry_calls, float('inf'))
+        put_call_by_expiry = dict(zip(oi_by_expiry_type.index, ratios.tolist()))
         
         # Calculate volume by strike
-        volume_by_strike = df.groupby("strike")["volume"].sum().to_dict()
+        volume_by_strike = df.groupby("strike", sort=False)["volume"].sum()
         
         # Find strikes with highest volume (potential oversubscribed zones)
-        high_volume_strikes = pd.Series(volume_by_strike).sort_values(ascending=False).head(10).to_dict()
+        high_volume_strikes = volume_by_strike.nlargest(10).to_frame("volume")
         
         # Calculate distance from current price for high volume strikes
-        high_volume_strikes_distance = {
-            strike: {
-                "volume": volume,
-                "distance_pct": ((strike - current_price) / current_price * 100)
-            }
-            for strike, volume in high_volume_strikes.items()
-        }
+        high_volume_strikes["distance_pct"] = (high_volume_strikes.index - current_price) / current_price * 100
         
         return {
-            "oi_by_expiry_strike": oi_by_expiry_strike.to_dict(),
-            "calls_oi_by_expiry_strike": calls_oi_by_expiry_strike.to_dict(),
-            "puts_oi_by_expiry_strike": puts_oi_by_expiry_strike.to_dict(),
+            "oi_by_expiry_strike": self._oi_to_columns(oi_by_expiry_strike),
+            "calls_oi_by_expiry_strike": self._oi_to_columns(calls_oi_by_expiry_strike),
+            "puts_oi_by_expiry_strike": self._oi_to_columns(puts_oi_by_expiry_strike),
             "put_call_by_expiry": put_call_by_expiry,
-            "volume_by_strike": volume_by_strike,
-            "high_volume_strikes": high_volume_strikes_distance
+            "volume_by_strike": volume_by_strike.sort_index().to_dict(),
+            "high_volume_strikes": high_volume_strikes.to_dict("index")
+        }
+    
+    @staticmethod
+    def _oi_to_columns(oi: pd.Series) -> Dict[str, List[Any]]:
+        """
+        Convert open interest indexed by expiration date and strike to column lists.
+        
+        Args:
+            oi: Open interest Series with expiration_date and strike index levels
+            
+        Returns:
+            Dictionary of expiration_date, strike and open_interest lists
+        """
+        oi = oi.sort_index()
+        return {
+            "expiration_date": oi.index.get_level_values("expiration_date").tolist(),
+            "strike": oi.index.get_level_values("strike").tolist(),
+            "open_interest": oi.tolist()
         }
     
-    def segment_by_expiration_timeframe(self) -> Dict[str, Any]:
+    def segment_by_expiration_timeframe(self, df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """
         Segment options data by expiration timeframes (near-term, mid-term, far-dated).
         
+        Args:
+            df: Options DataFrame (optional, built from the fetched data if not given)
+            
         Returns:
             Dictionary with segmented options data
         """
-        df = self.create_options_dataframe()
+        if df is None:
+            df = self.create_options_dataframe()
         
         # Define timeframes (in days)
         near_term_days = 14  # 0-14 days
         mid_term_days = 45   # 15-45 days
         # far-dated: > 45 days
         
-        # Segment data by timeframe
-        near_term = df[df["days_to_expiration"] <= near_term_days]
-        mid_term = df[(df["days_to_expiration"] > near_term_days) & (df["days_to_expiration"] <= mid_term_days)]
-        far_dated = df[df["days_to_expiration"] > mid_term_days]
+        # Label each option with its segment (0: near-term, 1: mid-term, 2: far-dated)
+        # and partition the data in a single groupby pass
+        segment_codes = np.digitize(
+            df["days_to_expiration"].to_numpy(), [near_term_days, mid_term_days], right=True
+        )
+        segment_frames = dict(iter(df.groupby(segment_codes, sort=False)))
+        empty = df.iloc[:0]
         
         # Calculate open interest and volume statistics for each segment
         segments = {
-            "near_term": self._calculate_segment_stats(near_term, "Near-term (0-14 days)"),
-            "mid_term": self._calculate_segment_stats(mid_term, "Mid-term (15-45 days)"),
-            "far_dated": self._calculate_segment_stats(far_dated, "Far-dated (>45 days)")
+            "near_term": self._calculate_segment_stats(segment_frames.get(0, empty), "Near-term (0-14 days)"),
+            "mid_term": self._calculate_segment_stats(segment_frames.get(1, empty), "Mid-term (15-45 days)"),
+            "far_dated": self._calculate_segment_stats(segment_frames.get(2, empty), "Far-dated (>45 days)")
         }
         
         return segments
@@ -321,30 +455,42 @@ class OptionsAnalyzer:
                 "top_strikes_by_volume": {}
             }
         
-        # Split into calls and puts
-        calls = segment_df[segment_df["option_type"] == "call"]
-        puts = segment_df[segment_df["option_type"] == "put"]
+        # Accumulate open interest and volume per option type and per strike
+        # with bincount over the category codes, one pass per array
+        open_interest = np.nan_to_num(segment_df["open_interest"].to_numpy(dtype=np.float64))
+        volume = np.nan_to_num(segment_df["volume"].to_numpy(dtype=np.float64))
+        
+        option_types = self.OPTION_TYPE_DTYPE.categories
+        type_codes = segment_df["option_type"].cat.codes.to_numpy()
+        oi_by_type = np.bincount(type_codes, weights=open_interest, minlength=len(option_types))
+        volume_by_type = np.bincount(type_codes, weights=volume, minlength=len(option_types))
+        call_code = option_types.get_loc("call")
+        put_code = option_types.get_loc("put")
+        
+        strike_codes, strikes = pd.factorize(segment_df["strike"], sort=True)
+        oi_by_strike = np.bincount(strike_codes, weights=open_interest, minlength=len(strikes))
+        volume_by_strike = np.bincount(strike_codes, weights=volume, minlength=len(strikes))
         
         # Calculate open interest statistics
-        total_oi = segment_df["open_interest"].sum()
-        calls_oi = calls["open_interest"].sum()
-        puts_oi = puts["open_interest"].sum()
+        total_oi = oi_by_type.sum()
+        calls_oi = oi_by_type[call_code]
+        puts_oi = oi_by_type[put_code]
         put_call_ratio = puts_oi / calls_oi if calls_oi > 0 else float('inf')
         
         # Calculate volume statistics
-        total_volume = segment_df["volume"].sum()
-        calls_volume = calls["volume"].sum()
-        puts_volume = puts["volume"].sum()
+        total_volume = volume_by_type.sum()
+        calls_volume = volume_by_type[call_code]
+        puts_volume = volume_by_type[put_code]
         volume_put_call_ratio = puts_volume / calls_volume if calls_volume > 0 else float('inf')
         
         # Get expirations in this segment
         expirations = sorted(segment_df["expiration_date"].unique())
         
         # Get top strikes by open interest
-        top_strikes_by_oi = segment_df.groupby("strike")["open_interest"].sum().sort_values(ascending=False).head(5).to_dict()
+        top_strikes_by_oi = pd.Series(oi_by_strike, index=strikes).nlargest(5).to_dict()
         
         # Get top strikes by volume
-        top_strikes_by_volume = segment_df.groupby("strike")["volume"].sum().sort_values(ascending=False).head(5).to_dict()
+        top_strikes_by_volume = pd.Series(volume_by_strike, index=strikes).nlargest(5).to_dict()
         
         return {
             "name": segment_name,
@@ -368,6 +514,8 @@ class OptionsAnalyzer:
         Args:
             save_path: Path to save the plot (optional)
         """
+        import matplotlib.pyplot as plt
+        
         df = self.create_options_dataframe()
         
         # Create pivot table of open interest by expiration date and strike
@@ -376,33 +524,38 @@ class OptionsAnalyzer:
             columns="strike", 
             values="open_interest", 
             aggfunc="sum",
-            fill_value=0
+            fill_value=0,
+            observed=True
         )
         
         # Sort by expiration date
         pivot = pivot.sort_index()
         
         # Create plot
-        plt.figure(figsize=(14, 10))
+        fig, ax = plt.subplots(figsize=(14, 10))
         
-        # Create heatmap
-        sns.heatmap(pivot, cmap="YlGnBu", annot=False, fmt=".0f", linewidths=0.5)
+        # Draw the heatmap directly from the underlying array
+        image = ax.imshow(pivot.to_numpy(), aspect="auto", cmap="YlGnBu", interpolation="nearest")
+        fig.colorbar(image, ax=ax)
         
         # Add labels and title
-        plt.xlabel("Strike Price")
-        plt.ylabel("Expiration Date")
-        plt.title(f"{self.data['currency']} Open Interest Heatmap")
+        ax.set_xlabel("Strike Price")
+        ax.set_ylabel("Expiration Date")
+        ax.set_title(f"{self.data['currency']} Open Interest Heatmap")
         
-        # Format x-axis labels
-        plt.xticks(rotation=45)
+        # Label at most ~40 strikes and ~30 expirations so tick labels stay readable
+        x_step = max(1, len(pivot.columns) // 40)
+        y_step = max(1, len(pivot.index) // 30)
+        ax.set_xticks(range(0, len(pivot.columns), x_step), pivot.columns[::x_step], rotation=45)
+        ax.set_yticks(range(0, len(pivot.index), y_step), pivot.index[::y_step])
         
         # Save or show the plot
         if save_path:
-            plt.savefig(save_path, bbox_inches="tight")
+            fig.savefig(save_path, bbox_inches="tight")
         else:
             plt.show()
         
-        plt.close()
+        plt.close(fig)
     
     def plot_segmented_open_interest(self, save_path: Optional[str] = None) -> None:
         """
@@ -411,6 +564,8 @@ class OptionsAnalyzer:
         Args:
             save_path: Path to save the plot (optional)
         """
+        import matplotlib.pyplot as plt
+        
         # Get segmented data
         segments = self.segment_by_expiration_timeframe()
         
@@ -425,47 +580,51 @@ class OptionsAnalyzer:
             puts_oi.append(data["puts_open_interest"])
         
         # Create plot
-        plt.figure(figsize=(12, 8))
+        fig, ax = plt.subplots(figsize=(12, 8))
         
         # Set up bar positions
         x = range(len(segment_names))
         width = 0.35
         
         # Plot bars
-        plt.bar([i - width/2 for i in x], calls_oi, width, label="Calls", color="green", alpha=0.7)
-        plt.bar([i + width/2 for i in x], puts_oi, width, label="Puts", color="red", alpha=0.7)
+        ax.bar([i - width/2 for i in x], calls_oi, width, label="Calls", color="green", alpha=0.7)
+        ax.bar([i + width/2 for i in x], puts_oi, width, label="Puts", color="red", alpha=0.7)
         
         # Add labels and title
-        plt.xlabel("Expiration Timeframe")
-        plt.ylabel("Open Interest")
-        plt.title(f"{self.data['currency']} Open Interest by Expiration Timeframe")
-        plt.xticks(x, segment_names)
-        plt.legend()
-        plt.grid(True, alpha=0.3)
+        ax.set_xlabel("Expiration Timeframe")
+        ax.set_ylabel("Open Interest")
+        ax.set_title(f"{self.data['currency']} Open Interest by Expiration Timeframe")
+        ax.set_xticks(x, segment_names)
+        ax.legend()
+        ax.grid(True, alpha=0.3)
         
         # Add put/call ratio labels
         for i, name in enumerate(segment_names):
             if calls_oi[i] > 0:
                 ratio = puts_oi[i] / calls_oi[i]
-                plt.text(i, max(calls_oi[i], puts_oi[i]) + 1000, f"P/C: {ratio:.2f}", 
+                ax.text(i, max(calls_oi[i], puts_oi[i]) + 1000, f"P/C: {ratio:.2f}", 
                          ha="center", va="bottom", fontweight="bold")
         
         # Save or show the plot
         if save_path:
-            plt.savefig(save_path)
+            fig.savefig(save_path)
         else:
             plt.show()
         
-        plt.close()
+        plt.close(fig)
     
-    def calculate_implied_volatility_summary(self) -> Dict[str, Any]:
+    def calculate_implied_volatility_summary(self, df: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
         """
         Calculate summary statistics for implied volatility.
         
+        Args:
+            df: Options DataFrame (optional, built from the fetched data if not given)
+            
         Returns:
             Dictionary with implied volatility summary
         """
-        df = self.create_options_dataframe()
+        if df is None:
+            df = self.create_options_dataframe()
         
         # Filter out rows with missing mark_iv
         df_with_iv = df[df["mark_iv"].notna()]
@@ -485,7 +644,7 @@ class OptionsAnalyzer:
         max_iv = df_with_iv["mark_iv"].max()
         
         # Calculate IV by expiration
-        iv_by_expiration = df_with_iv.groupby("expiration_date")["mark_iv"].mean().sort_index().to_dict()
+        iv_by_expiration = df_with_iv.groupby("expiration_date", sort=False, observed=True)["mark_iv"].mean().sort_index().to_dict()
         
         # Calculate IV by strike (for strikes near the current price)
         current_price = self.data["index_price"]
@@ -493,7 +652,7 @@ class OptionsAnalyzer:
             (df_with_iv["strike"] >= current_price * 0.8) & 
             (df_with_iv["strike"] <= current_price * 1.2)
         ]
-        iv_by_strike = near_strikes.groupby("strike")["mark_iv"].mean().sort_index().to_dict()
+        iv_by_strike = near_strikes.groupby("strike", sort=False)["mark_iv"].mean().sort_index().to_dict()
         
         return {
             "average_iv": avg_iv,
@@ -514,9 +673,12 @@ class OptionsAnalyzer:
         if not self.data or "options" not in self.data:
             raise ValueError("No options data available. Call fetch_options_data first.")
         
+        # Build the DataFrame once and share it with every analysis below
+        df = self.create_options_dataframe()
+        
         # Calculate summaries
-        oi_summary = self.calculate_open_interest_summary()
-        iv_summary = self.calculate_implied_volatility_summary()
+        oi_summary = self.calculate_open_interest_summary(df)
+        iv_summary = self.calculate_implied_volatility_summary(df)
         
         # Get current price
         current_price = self.data["index_price"]
@@ -531,18 +693,18 @@ class OptionsAnalyzer:
         volume_put_call_ratio = puts_volume / calls_volume if calls_volume > 0 else float('inf')
         
         # Identify options with largest open interest
-        top_oi_calls = calls.sort_values("open_interest", ascending=False).head(5)
-        top_oi_puts = puts.sort_values("open_interest", ascending=False).head(5)
+        top_oi_calls = calls.nlargest(5, "open_interest")
+        top_oi_puts = puts.nlargest(5, "open_interest")
         
         # Identify options with largest volume
-        top_volume_calls = calls.sort_values("volume", ascending=False).head(5)
-        top_volume_puts = puts.sort_values("volume", ascending=False).head(5)
+        top_volume_calls = calls.nlargest(5, "volume")
+        top_volume_puts = puts.nlargest(5, "volume")
         
         # Get open interest by strike and expiry analysis
-        oi_by_strike_expiry = self.analyze_open_interest_by_strike_and_expiry()
+        oi_by_strike_expiry = self.analyze_open_interest_by_strike_and_expiry(df)
         
         # Get segmented data by expiration timeframe
-        segmented_data = self.segment_by_expiration_timeframe()
+        segmented_data = self.segment_by_expiration_timeframe(df)
         
         return {
             "timestamp": datetime.now().isoformat(),
@@ -579,81 +741,86 @@ class OptionsAnalyzer:
         Args:
             summary: Summary dictionary from generate_daily_summary
         """
-        print(f"\n{'=' * 80}")
-        print(f"OPTIONS SUMMARY FOR {summary['currency']} - {summary['timestamp']}")
-        print(f"{'=' * 80}")
+        from tabulate import tabulate
         
-        print(f"\nCurrent Price: ${summary['current_price']:,.2f}")
+        # Collect the lines and write them in one go
+        out = []
+        
+        out.append(f"\n{'=' * 80}")
+        out.append(f"OPTIONS SUMMARY FOR {summary['currency']} - {summary['timestamp']}")
+        out.append(f"{'=' * 80}")
+        
+        out.append(f"\nCurrent Price: ${summary['current_price']:,.2f}")
         
         # Print open interest summary
         oi = summary["open_interest_summary"]
-        print(f"\n{'-' * 40}")
-        print("OPEN INTEREST SUMMARY")
-        print(f"{'-' * 40}")
-        print(f"Total Open Interest: {oi['total_open_interest']:,.0f}")
-        print(f"Calls Open Interest: {oi['calls_open_interest']:,.0f}")
-        print(f"Puts Open Interest: {oi['puts_open_interest']:,.0f}")
-        print(f"Put/Call Ratio: {oi['put_call_ratio']:.2f}")
+        out.append(f"\n{'-' * 40}")
+        out.append("OPEN INTEREST SUMMARY")
+        out.append(f"{'-' * 40}")
+        out.append(f"Total Open Interest: {oi['total_open_interest']:,.0f}")
+        out.append(f"Calls Open Interest: {oi['calls_open_interest']:,.0f}")
+        out.append(f"Puts Open Interest: {oi['puts_open_interest']:,.0f}")
+        out.append(f"Put/Call Ratio: {oi['put_call_ratio']:.2f}")
         
         # Print top expirations by open interest
-        print("\nTop Expirations by Open Interest:")
+        out.append("\nTop Expirations by Open Interest:")
         for date, oi_value in oi["top_expirations"].items():
-            print(f"  {date}: {oi_value:,.0f}")
+            out.append(f"  {date}: {oi_value:,.0f}")
         
         # Print top strikes by open interest
-        print("\nTop Strikes by Open Interest:")
+        out.append("\nTop Strikes by Open Interest:")
         for strike, oi_value in oi["top_strikes"].items():
-            print(f"  ${strike:,.0f}: {oi_value:,.0f}")
+            out.append(f"  ${strike:,.0f}: {oi_value:,.0f}")
         
         # Print implied volatility summary
         iv = summary["implied_volatility_summary"]
-        print(f"\n{'-' * 40}")
-        print("IMPLIED VOLATILITY SUMMARY")
-        print(f"{'-' * 40}")
+        out.append(f"\n{'-' * 40}")
+        out.append("IMPLIED VOLATILITY SUMMARY")
+        out.append(f"{'-' * 40}")
         
         if iv["average_iv"] is not None:
-            print(f"Average IV: {iv['average_iv']:.2%}")
-            print(f"Min IV: {iv['min_iv']:.2%}")
-            print(f"Max IV: {iv['max_iv']:.2%}")
+            out.append(f"Average IV: {iv['average_iv']:.2%}")
+            out.append(f"Min IV: {iv['min_iv']:.2%}")
+            out.append(f"Max IV: {iv['max_iv']:.2%}")
             
             # Print IV by expiration
-            print("\nIV by Expiration:")
+            out.append("\nIV by Expiration:")
             for date, iv_value in iv["iv_by_expiration"].items():
-                print(f"  {date}: {iv_value:.2%}")
+                out.append(f"  {date}: {iv_value:.2%}")
         else:
-            print("No implied volatility data available.")
+            out.append("No implied volatility data available.")
         
         # Print volume statistics
         vol = summary["volume_statistics"]
-        print(f"\n{'-' * 40}")
-        print("VOLUME STATISTICS")
-        print(f"{'-' * 40}")
-        print(f"Total Volume: {vol['total_volume']:,.0f}")
-        print(f"Calls Volume: {vol['calls_volume']:,.0f}")
-        print(f"Puts Volume: {vol['puts_volume']:,.0f}")
-        print(f"Volume Put/Call Ratio: {vol['volume_put_call_ratio']:.2f}")
+        out.append(f"\n{'-' * 40}")
+        out.append("VOLUME STATISTICS")
+        out.append(f"{'-' * 40}")
+        out.append(f"Total Volume: {vol['total_volume']:,.0f}")
+        out.append(f"Calls Volume: {vol['calls_volume']:,.0f}")
+        out.append(f"Puts Volume: {vol['puts_volume']:,.0f}")
+        out.append(f"Volume Put/Call Ratio: {vol['volume_put_call_ratio']:.2f}")
         
         # Print segmented data
-        print(f"\n{'-' * 40}")
-        print("EXPIRATION TIMEFRAME ANALYSIS")
-        print(f"{'-' * 40}")
+        out.append(f"\n{'-' * 40}")
+        out.append("EXPIRATION TIMEFRAME ANALYSIS")
+        out.append(f"{'-' * 40}")
         
         for segment_key, segment_data in summary["segmented_data"].items():
-            print(f"\n{segment_data['name']}:")
-            print(f"  Open Interest: {segment_data['total_open_interest']:,.0f} (Calls: {segment_data['calls_open_interest']:,.0f}, Puts: {segment_data['puts_open_interest']:,.0f})")
-            print(f"  Put/Call Ratio: {segment_data['put_call_ratio']:.2f}")
-            print(f"  Volume: {segment_data['total_volume']:,.0f} (Calls: {segment_data['calls_volume']:,.0f}, Puts: {segment_data['puts_volume']:,.0f})")
-            print(f"  Volume Put/Call Ratio: {segment_data['volume_put_call_ratio']:.2f}")
+            out.append(f"\n{segment_data['name']}:")
+            out.append(f"  Open Interest: {segment_data['total_open_interest']:,.0f} (Calls: {segment_data['calls_open_interest']:,.0f}, Puts: {segment_data['puts_open_interest']:,.0f})")
+            out.append(f"  Put/Call Ratio: {segment_data['put_call_ratio']:.2f}")
+            out.append(f"  Volume: {segment_data['total_volume']:,.0f} (Calls: {segment_data['calls_volume']:,.0f}, Puts: {segment_data['puts_volume']:,.0f})")
+            out.append(f"  Volume Put/Call Ratio: {segment_data['volume_put_call_ratio']:.2f}")
             
             if segment_data['top_strikes_by_oi']:
-                print("  Top Strikes by Open Interest:")
+                out.append("  Top Strikes by Open Interest:")
                 for strike, oi_value in segment_data['top_strikes_by_oi'].items():
-                    print(f"    ${strike:,.0f}: {oi_value:,.0f}")
+                    out.append(f"    ${strike:,.0f}: {oi_value:,.0f}")
         
         # Print high volume strikes (potential oversubscribed zones)
-        print(f"\n{'-' * 40}")
-        print("HIGH VOLUME STRIKES (POTENTIAL OVERSUBSCRIBED ZONES)")
-        print(f"{'-' * 40}")
+        out.append(f"\n{'-' * 40}")
+        out.append("HIGH VOLUME STRIKES (POTENTIAL OVERSUBSCRIBED ZONES)")
+        out.append(f"{'-' * 40}")
         
         high_vol_strikes = summary["open_interest_analysis"]["high_volume_strikes"]
         high_vol_data = []
@@ -665,48 +832,50 @@ class OptionsAnalyzer:
                 f"{data['distance_pct']:.2f}%"
             ])
         
-        print(tabulate(high_vol_data, headers=["Strike", "Volume", "Distance from Current Price"]))
+        out.append(tabulate(high_vol_data, headers=["Strike", "Volume", "Distance from Current Price"]))
         
         # Print put/call ratio by expiration
-        print(f"\n{'-' * 40}")
-        print("PUT/CALL RATIO BY EXPIRATION")
-        print(f"{'-' * 40}")
+        out.append(f"\n{'-' * 40}")
+        out.append("PUT/CALL RATIO BY EXPIRATION")
+        out.append(f"{'-' * 40}")
         
         pc_by_expiry = summary["open_interest_analysis"]["put_call_by_expiry"]
         pc_by_expiry_data = [[date, f"{ratio:.2f}"] for date, ratio in pc_by_expiry.items()]
-        print(tabulate(pc_by_expiry_data, headers=["Expiration Date", "Put/Call Ratio"]))
+        out.append(tabulate(pc_by_expiry_data, headers=["Expiration Date", "Put/Call Ratio"]))
         
         # Print top open interest options
-        print(f"\n{'-' * 40}")
-        print("TOP OPTIONS BY OPEN INTEREST")
-        print(f"{'-' * 40}")
+        out.append(f"\n{'-' * 40}")
+        out.append("TOP OPTIONS BY OPEN INTEREST")
+        out.append(f"{'-' * 40}")
         
-        print("\nTop Calls by Open Interest:")
+        out.append("\nTop Calls by Open Interest:")
         calls_oi_data = [[c["instrument_name"], f"${c['strike']:,.0f}", c["expiration_date"], f"{c['open_interest']:,.0f}"] 
                         for c in summary["top_open_interest"]["calls"]]
-        print(tabulate(calls_oi_data, headers=["Instrument", "Strike", "Expiration", "Open Interest"]))
+        out.append(tabulate(calls_oi_data, headers=["Instrument", "Strike", "Expiration", "Open Interest"]))
         
-        print("\nTop Puts by Open Interest:")
+        out.append("\nTop Puts by Open Interest:")
         puts_oi_data = [[p["instrument_name"], f"${p['strike']:,.0f}", p["expiration_date"], f"{p['open_interest']:,.0f}"] 
                        for p in summary["top_open_interest"]["puts"]]
-        print(tabulate(puts_oi_data, headers=["Instrument", "Strike", "Expiration", "Open Interest"]))
+        out.append(tabulate(puts_oi_data, headers=["Instrument", "Strike", "Expiration", "Open Interest"]))
         
         # Print top volume options
-        print(f"\n{'-' * 40}")
-        print("TOP OPTIONS BY VOLUME")
-        print(f"{'-' * 40}")
+        out.append(f"\n{'-' * 40}")
+        out.append("TOP OPTIONS BY VOLUME")
+        out.append(f"{'-' * 40}")
         
-        print("\nTop Calls by Volume:")
+        out.append("\nTop Calls by Volume:")
         calls_vol_data = [[c["instrument_name"], f"${c['strike']:,.0f}", c["expiration_date"], f"{c['volume']:,.0f}"] 
                          for c in summary["top_volume"]["calls"]]
-        print(tabulate(calls_vol_data, headers=["Instrument", "Strike", "Expiration", "Volume"]))
+        out.append(tabulate(calls_vol_data, headers=["Instrument", "Strike", "Expiration", "Volume"]))
         
-        print("\nTop Puts by Volume:")
+        out.append("\nTop Puts by Volume:")
         puts_vol_data = [[p["instrument_name"], f"${p['strike']:,.0f}", p["expiration_date"], f"{p['volume']:,.0f}"] 
                         for p in summary["top_volume"]["puts"]]
-        print(tabulate(puts_vol_data, headers=["Instrument", "Strike", "Expiration", "Volume"]))
+        out.append(tabulate(puts_vol_data, headers=["Instrument", "Strike", "Expiration", "Volume"]))
+        
+        out.append(f"\n{'=' * 80}\n")
         
-        print(f"\n{'=' * 80}\n")
+        sys.stdout.write("\n".join(out) + "\n")
     
     def plot_open_interest_distribution(self, save_path: Optional[str] = None) -> None:
         """
@@ -715,6 +884,9 @@ class OptionsAnalyzer:
         Args:
             save_path: Path to save the plot (optional)
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.ticker import StrMethodFormatter
+        
         df = self.create_options_dataframe()
         calls, puts = self.get_calls_and_puts()
         
@@ -729,36 +901,36 @@ class OptionsAnalyzer:
         filtered_puts = puts[(puts["strike"] >= min_strike) & (puts["strike"] <= max_strike)]
         
         # Group by strike
-        calls_by_strike = filtered_calls.groupby("strike")["open_interest"].sum()
-        puts_by_strike = filtered_puts.groupby("strike")["open_interest"].sum()
+        calls_by_strike = filtered_calls.groupby("strike", sort=False)["open_interest"].sum()
+        puts_by_strike = filtered_puts.groupby("strike", sort=False)["open_interest"].sum()
         
         # Create plot
-        plt.figure(figsize=(12, 8))
+        fig, ax = plt.subplots(figsize=(12, 8))
         
         # Plot calls and puts
-        plt.bar(calls_by_strike.index, calls_by_strike.values, alpha=0.7, color="green", label="Calls")
-        plt.bar(puts_by_strike.index, -puts_by_strike.values, alpha=0.7, color="red", label="Puts")
+        ax.bar(calls_by_strike.index, calls_by_strike.values, alpha=0.7, color="green", label="Calls")
+        ax.bar(puts_by_strike.index, -puts_by_strike.values, alpha=0.7, color="red", label="Puts")
         
         # Add current price line
-        plt.axvline(x=current_price, color="black", linestyle="--", label=f"Current Price (${current_price:,.0f})")
+        ax.axvline(x=current_price, color="black", linestyle="--", label=f"Current Price (${current_price:,.0f})")
         
         # Add labels and title
-        plt.xlabel("Strike Price")
-        plt.ylabel("Open Interest")
-        plt.title(f"{self.data['currency']} Options Open Interest Distribution")
-        plt.legend()
-        plt.grid(True, alpha=0.3)
+        ax.set_xlabel("Strike Price")
+        ax.set_ylabel("Open Interest")
+        ax.set_title(f"{self.data['currency']} Options Open Interest Distribution")
+        ax.legend()
+        ax.grid(True, alpha=0.3)
         
         # Format x-axis labels
-        plt.gca().xaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f"${x:,.0f}"))
+        ax.xaxis.set_major_formatter(StrMethodFormatter(self.STRIKE_TICK_FORMAT))
         
         # Save or show the plot
         if save_path:
-            plt.savefig(save_path)
+            fig.savefig(save_path)
         else:
             plt.show()
         
-        plt.close()
+        plt.close(fig)
     
     def plot_implied_volatility_smile(self, expiration_date: Optional[str] = None, save_path: Optional[str] = None) -> None:
         """
@@ -768,6 +940,9 @@ class OptionsAnalyzer:
             expiration_date: Expiration date to plot (optional, uses nearest if not specified)
             save_path: Path to save the plot (optional)
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.ticker import PercentFormatter, StrMethodFormatter
+        
         df = self.create_options_dataframe()
         
         # Filter out rows with missing mark_iv
@@ -777,17 +952,10 @@ class OptionsAnalyzer:
             print("No implied volatility data available.")
             return
         
-        # If no expiration date is specified, use the nearest one
+        # If no expiration date is specified, use the nearest one (df is not
+        # empty here, so there is at least one)
         if not expiration_date:
-            expirations = df["expiration_date"].unique()
-            if len(expirations) == 0:
-                print("No expiration dates available.")
-                return
-            
-            # Sort by days to expiration and take the first one
-            df_exp = df[["expiration_date", "days_to_expiration"]].drop_duplicates()
-            df_exp = df_exp.sort_values("days_to_expiration")
-            expiration_date = df_exp.iloc[0]["expiration_date"]
+            expiration_date = df.loc[df["days_to_expiration"].idxmin(), "expiration_date"]
         
         # Filter to the specified expiration date
         df_exp = df[df["expiration_date"] == expiration_date]
@@ -800,39 +968,40 @@ class OptionsAnalyzer:
         current_price = self.data["index_price"]
         
         # Create plot
-        plt.figure(figsize=(12, 8))
+        fig, ax = plt.subplots(figsize=(12, 8))
         
         # Plot calls and puts
-        calls = df_exp[df_exp["option_type"] == "call"]
-        puts = df_exp[df_exp["option_type"] == "put"]
+        options_by_type = dict(list(df_exp.groupby("option_type", sort=False, observed=True)))
+        calls = options_by_type.get("call")
+        puts = options_by_type.get("put")
         
-        if not calls.empty:
-            plt.scatter(calls["strike"], calls["mark_iv"], color="green", alpha=0.7, label="Calls")
+        if calls is not None:
+            ax.scatter(calls["strike"], calls["mark_iv"], color="green", alpha=0.7, label="Calls")
         
-        if not puts.empty:
-            plt.scatter(puts["strike"], puts["mark_iv"], color="red", alpha=0.7, label="Puts")
+        if puts is not None:
+            ax.scatter(puts["strike"], puts["mark_iv"], color="red", alpha=0.7, label="Puts")
         
         # Add current price line
-        plt.axvline(x=current_price, color="black", linestyle="--", label=f"Current Price (${current_price:,.0f})")
+        ax.axvline(x=current_price, color="black", linestyle="--", label=f"Current Price (${current_price:,.0f})")
         
         # Add labels and title
-        plt.xlabel("Strike Price")
-        plt.ylabel("Implied Volatility")
-        plt.title(f"{self.data['currency']} Implied Volatility Smile - {expiration_date}")
-        plt.legend()
-        plt.grid(True, alpha=0.3)
+        ax.set_xlabel("Strike Price")
+        ax.set_ylabel("Implied Volatility")
+        ax.set_title(f"{self.data['currency']} Implied Volatility Smile - {expiration_date}")
+        ax.legend()
+        ax.grid(True, alpha=0.3)
         
         # Format axes
-        plt.gca().xaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f"${x:,.0f}"))
-        plt.gca().yaxis.set_major_formatter(plt.FuncFormatter(lambda y, _: f"{y:.1%}"))
+        ax.xaxis.set_major_formatter(StrMethodFormatter(self.STRIKE_TICK_FORMAT))
+        ax.yaxis.set_major_formatter(PercentFormatter(xmax=1.0, decimals=self.IV_TICK_DECIMALS))
         
         # Save or show the plot
         if save_path:
-            plt.savefig(save_path)
+            fig.savefig(save_path)
         else:
             plt.show()
         
-        plt.close()
+        plt.close(fig)
     
     def plot_volatility_surface(self, save_path: Optional[str] = None) -> None:
         """
@@ -841,6 +1010,9 @@ class OptionsAnalyzer:
         Args:
             save_path: Path to save the plot (optional)
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.ticker import PercentFormatter, StrMethodFormatter
+        
         df = self.create_options_dataframe()
         
         # Filter out rows with missing mark_iv
@@ -850,39 +1022,44 @@ class OptionsAnalyzer:
             print("No implied volatility data available.")
             return
         
-        # Convert expiration dates to numerical values (days to expiration)
-        df = df.copy()  # Create a copy to avoid SettingWithCopyWarning
-        
         # Create the 3D plot
         fig = plt.figure(figsize=(12, 8))
         ax = fig.add_subplot(111, projection='3d')
         
         # Plot surface for calls and puts separately
+        options_by_type = dict(list(df.groupby("option_type", sort=False, observed=True)))
         for option_type, color in [("call", "green"), ("put", "red")]:
-            option_data = df[df["option_type"] == option_type]
+            option_data = options_by_type.get(option_type)
             
-            if not option_data.empty:
-                # Create a meshgrid for the surface
-                strikes = np.array(sorted(option_data["strike"].unique()))
-                days = np.array(sorted(option_data["days_to_expiration"].unique()))
-                X, Y = np.meshgrid(strikes, days)
-                
-                # Create Z values (implied volatility)
-                Z = np.zeros_like(X)
-                for i, day in enumerate(days):
-                    for j, strike in enumerate(strikes):
-                        matching_data = option_data[
-                            (option_data["days_to_expiration"] == day) & 
-                            (option_data["strike"] == strike)
-                        ]
-                        if not matching_data.empty:
-                            Z[i, j] = matching_data["mark_iv"].iloc[0]
-                        else:
-                            # Use NaN for missing values
-                            Z[i, j] = np.nan
+            if option_data is not None:
+                # Triangulate the observed (strike, days) points directly, so the
+                # surface only has polygons where there are quotes
+                points = option_data.drop_duplicates(["days_to_expiration", "strike"])
+                try:
+                    surf = ax.plot_trisurf(
+                        points["strike"].to_numpy(), points["days_to_expiration"].to_numpy(),
+                        points["mark_iv"].to_numpy(), alpha=0.5, cmap=plt.cm.coolwarm,
+                        label=option_type.capitalize()
+                    )
+                except (ValueError, RuntimeError):
+                    # Fewer than three distinct or only collinear points, which cannot be
+                    # triangulated; fall back to a surface over the strike/day grid
+                    point_strikes = points["strike"].to_numpy()
+                    point_days = points["days_to_expiration"].to_numpy()
+                    strikes = np.unique(point_strikes)
+                    days = np.unique(point_days)
+                    X = strikes[np.newaxis, :]
+                    Y = days[:, np.newaxis]
+                    
+                    # Create Z values (implied volatility) by placing each point in its
+                    # grid cell, with NaN for missing values
+                    Z = np.full((days.size, strikes.size), np.nan)
+                    Z[np.searchsorted(days, point_days), np.searchsorted(strikes, point_strikes)] = (
+                        points["mark_iv"].to_numpy()
+                    )
+                    
+                    surf = ax.plot_surface(X, Y, Z, alpha=0.5, cmap=plt.cm.coolwarm, label=option_type.capitalize())
                 
-                # Plot the surface
-                surf = ax.plot_surface(X, Y, Z, alpha=0.5, cmap=plt.cm.coolwarm, label=option_type.capitalize())
                 surf._facecolors2d = surf._facecolor3d
                 surf._edgecolors2d = surf._edgecolor3d
         
@@ -896,16 +1073,16 @@ class OptionsAnalyzer:
         ax.legend()
         
         # Format axes
-        ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, _: f'${x:,.0f}'))
-        ax.zaxis.set_major_formatter(plt.FuncFormatter(lambda z, _: f'{z:.1%}'))
+        ax.xaxis.set_major_formatter(StrMethodFormatter(self.STRIKE_TICK_FORMAT))
+        ax.zaxis.set_major_formatter(PercentFormatter(xmax=1.0, decimals=self.IV_TICK_DECIMALS))
         
         # Save or show the plot
         if save_path:
-            plt.savefig(save_path, bbox_inches='tight')
+            fig.savefig(save_path, bbox_inches='tight')
         else:
             plt.show()
         
-        plt.close()
+        plt.close(fig)
     
     def identify_volatility_skew_hotspots(self, threshold_pct: float = 20.0) -> Dict[str, Any]:
         """
@@ -925,50 +1102,60 @@ class OptionsAnalyzer:
         if df.empty:
             return {"hotspots": [], "summary": "No implied volatility data available."}
         
-        hotspots = []
-        
-        # Analyze each expiration date separately
-        for expiry in df["expiration_date"].unique():
-            expiry_data = df[df["expiration_date"] == expiry]
-            
-            # Calculate mean IV for this expiration
-            mean_iv = expiry_data["mark_iv"].mean()
-            
-            # Find strikes with significant IV deviation
-            for option_type in ["call", "put"]:
-                type_data = expiry_data[expiry_data["option_type"] == option_type]
-                
-                for _, row in type_data.iterrows():
-                    iv_deviation_pct = ((row["mark_iv"] - mean_iv) / mean_iv) * 100
-                    
-                    if abs(iv_deviation_pct) >= threshold_pct:
-                        hotspots.append({
-                            "expiration_date": expiry,
-                            "strike": row["strike"],
-                            "option_type": option_type,
-                            "implied_volatility": row["mark_iv"],
-                            "mean_iv": mean_iv,
-                            "deviation_pct": iv_deviation_pct,
-                            "days_to_expiration": row["days_to_expiration"],
-                            "volume": row["volume"],
-                            "open_interest": row["open_interest"]
-                        })
-        
-        # Sort hotspots by absolute deviation percentage
-        hotspots.sort(key=lambda x: abs(x["deviation_pct"]), reverse=True)
-        
-        # Create summary statistics
+        # Calculate mean IV for each expiration with one bincount pass over the
+        # expiration codes (numbered in order of appearance)
+        expiry_codes = pd.factorize(df["expiration_date"])[0]
+        iv = df["mark_iv"].to_numpy()
+        mean_by_expiry = np.bincount(expiry_codes, weights=iv) / np.bincount(expiry_codes)
+        row_mean_iv = mean_by_expiry[expiry_codes]
+        
+        # A near-zero mean would flag every option of that expiration, so skip those
+        has_mean = np.isfinite(row_mean_iv) & (row_mean_iv > self.MIN_MEAN_IV)
+        row_deviation = np.divide(
+            iv - row_mean_iv, row_mean_iv, out=np.full_like(iv, np.nan), where=has_mean
+        ) * 100
+        
+        # Find calls and puts with significant IV deviation
+        call_code, put_code = self.OPTION_TYPE_DTYPE.categories.get_indexer(["call", "put"])
+        type_codes = df["option_type"].cat.codes.to_numpy()
+        is_hotspot = (
+            has_mean & (np.abs(row_deviation) >= threshold_pct)
+            & ((type_codes == call_code) | (type_codes == put_code))
+        )
+        positions = np.flatnonzero(is_hotspot)
+        abs_deviation = np.abs(row_deviation[positions])
+        hot_type_codes = type_codes[positions]
+        
+        # Sort hotspots by absolute deviation percentage, keeping ties grouped by
+        # expiration (in order of appearance) and then calls before puts
+        positions = positions[np.lexsort((hot_type_codes, expiry_codes[positions], -abs_deviation))]
+        
+        # Gather only the hotspot rows, in sorted order
+        hot_rows = df.iloc[positions]
+        hot = pd.DataFrame({
+            "expiration_date": hot_rows["expiration_date"].astype(str),
+            "strike": hot_rows["strike"],
+            "option_type": hot_rows["option_type"].astype(str),
+            "implied_volatility": hot_rows["mark_iv"],
+            "mean_iv": row_mean_iv[positions],
+            "deviation_pct": row_deviation[positions],
+            "days_to_expiration": hot_rows["days_to_expiration"],
+            "volume": hot_rows["volume"],
+            "open_interest": hot_rows["open_interest"]
+        })
+        
+        # Create summary statistics from the deviation and type code arrays
         summary = {
-            "total_hotspots": len(hotspots),
-            "max_deviation": max([abs(h["deviation_pct"]) for h in hotspots]) if hotspots else 0,
-            "avg_deviation": np.mean([abs(h["deviation_pct"]) for h in hotspots]) if hotspots else 0,
+            "total_hotspots": len(hot),
+            "max_deviation": abs_deviation.max() if abs_deviation.size else 0,
+            "avg_deviation": abs_deviation.mean() if abs_deviation.size else 0,
             "hotspots_by_type": {
-                "calls": len([h for h in hotspots if h["option_type"] == "call"]),
-                "puts": len([h for h in hotspots if h["option_type"] == "put"])
+                "calls": int(np.count_nonzero(hot_type_codes == call_code)),
+                "puts": int(np.count_nonzero(hot_type_codes == put_code))
             }
         }
         
         return {
-            "hotspots": hotspots,
+            "hotspots": hot.to_dict("records"),
             "summary": summary
         } 
\ No newline at end of file
@@ -3,6 +3,7 @@
 import os
 import sys
 import subprocess
+import threading
 from datetime import datetime
 import argparse
 
@@ -18,6 +19,18 @@ def parse_arguments():
     
     return parser.parse_args()
 
+def start_collection(currency):
+    """Start the main script for a currency with its output piped back line by line."""
+    cmd = ["python3", "src/main.py", "--currency", currency, "--output", "csv", "--plot"]
+    env = dict(os.environ, PYTHONUNBUFFERED="1")
+    return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env)
+
+def stream_output(proc, label):
+    """Echo a child process's output as it arrives, prefixing each line with a label."""
+    for line in proc.stdout:
+        sys.stdout.write(f"[{label}] {line}")
+    proc.stdout.close()
+
 def main():
     """Run the daily options data collection and consolidated summary."""
     args = parse_arguments()
@@ -30,29 +43,31 @@ def main():
     output_dir = "output"
     os.makedirs(output_dir, exist_ok=True)
     
-    # Step 1: Run the main script for BTC
+    # Steps 1 and 2: Run the main script for BTC and ETH concurrently,
+    # streaming their output as it is produced
     print("\nStep 1: Collecting BTC options data...")
-    btc_cmd = ["python3", "src/main.py", "--currency", "BTC", "--output", "csv", "--plot"]
-    btc_result = subprocess.run(btc_cmd, capture_output=True, text=True)
+    btc_proc = start_collection("BTC")
     
-    if btc_result.returncode != 0:
-        print("Error collecting BTC data:")
-        print(btc_result.stderr)
-        return 1
+    print("\nStep 2: Collecting ETH options data...")
+    eth_proc = start_collection("ETH")
     
-    print(btc_result.stdout)
+    streams = [
+        threading.Thread(target=stream_output, args=(btc_proc, "BTC")),
+        threading.Thread(target=stream_output, args=(eth_proc, "ETH"))
+    ]
+    for stream in streams:
+        stream.start()
+    for stream in streams:
+        stream.join()
     
-    # Step 2: Run the main script for ETH
-    print("\nStep 2: Collecting ETH options data...")
-    eth_cmd = ["python3", "src/main.py", "--currency", "ETH", "--output", "csv", "--plot"]
-    eth_result = subprocess.run(eth_cmd, capture_output=True, text=True)
+    if btc_proc.wait() != 0:
+        print("Error collecting BTC data (see output above)")
     
-    if eth_result.returncode != 0:
-        print("Error collecting ETH data:")
-        print(eth_result.stderr)
-        return 1
+    if eth_proc.wait() != 0:
+        print("Error collecting ETH data (see output above)")
     
-    print(eth_result.stdout)
+    if btc_proc.returncode != 0 or eth_proc.returncode != 0:
+        return 1
     
     # Step 3: Generate consolidated summary
     print("\nStep 3: Generating consolidated summary...")
@@ -62,15 +77,14 @@ def main():
     if not args.no_pdf:
         summary_cmd.append("--pdf")
     
-    summary_result = subprocess.run(summary_cmd, capture_output=True, text=True)
+    # Let the summary script write straight to the console
+    sys.stdout.flush()
+    summary_result = subprocess.run(summary_cmd)
     
     if summary_result.returncode != 0:
-        print("Error generating consolidated summary:")
-        print(summary_result.stderr)
+        print("Error generating consolidated summary (see output above)")
         return 1
     
-    print(summary_result.stdout)
-    
     print("\n" + "="*80)
     print("Daily summary completed successfully!")
     print("="*80)
@@ -8,7 +8,7 @@ from unittest.mock import patch, MagicMock
 # Add the src directory to the path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
 
-from deribit_client import DeribitClient
+from deribit_client import DeribitClient, DeribitAPIError
 
 
 class TestDeribitClient(unittest.TestCase):
@@ -41,6 +41,22 @@ class TestDeribitClient(unittest.TestCase):
         args, kwargs = mock_session.get.call_args
         self.assertEqual(kwargs["params"], {"param": "value"})
     
+    def test_make_request_api_error(self):
+        """Test that _make_request raises DeribitAPIError on an API error."""
+        # Create a mock for the session
+        mock_session = MagicMock()
+        self.client.session = mock_session
+        
+        # Mock a successful HTTP response carrying an API error
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"error": {"code": 10009, "message": "not_enough_funds"}}
+        mock_session.get.return_value = mock_response
+        
+        # Call the method
+        with self.assertRaises(DeribitAPIError):
+            self.client._make_request("test_method", {"param": "value"})
+    
     @patch("deribit_client.DeribitClient._make_request")
     def test_get_instruments(self, mock_make_request):
         """Test the get_instruments method."""
@@ -76,6 +92,20 @@ class TestDeribitClient(unittest.TestCase):
         mock_make_request.assert_called_once_with("get_index_price", {
             "index_name": "btc_usd"
         })
+    
+    @patch("deribit_client.DeribitClient._make_request")
+    def test_get_index_price_cached(self, mock_make_request):
+        """Test that get_index_price reuses a recent result."""
+        # Mock the response
+        mock_make_request.return_value = {"index_price": 50000.0}
+        
+        # Call the method twice within the TTL
+        first = self.client.get_index_price("BTC")
+        second = self.client.get_index_price("BTC")
+        
+        # Check that only one request was made
+        self.assertEqual(first, second)
+        mock_make_request.assert_called_once()
 
 
 if __name__ == "__main__":
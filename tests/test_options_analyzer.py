@@ -2,6 +2,7 @@
 
 import os
 import sys
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
 from datetime import datetime
@@ -134,6 +135,144 @@ class TestOptionsAnalyzer(unittest.TestCase):
         self.assertEqual(df.iloc[1]["strike"], 40000.0)
         self.assertEqual(df.iloc[1]["expiration_date"], "2021-12-31")
     
+    def test_create_options_dataframe_cached(self):
+        """Test that create_options_dataframe is reused until data is refetched."""
+        # Mock the client methods
+        self.client.get_index_price.return_value = {"index_price": 50000.0}
+        self.client.get_option_instruments_by_currency.return_value = [
+            {
+                "instrument_name": "BTC-31DEC21-60000-C",
+                "expiration_timestamp": 1640908800000,
+                "creation_timestamp": 1609459200000,
+                "strike": 60000.0
+            }
+        ]
+        self.client.get_option_summary_by_currency.return_value = [
+            {
+                "instrument_name": "BTC-31DEC21-60000-C",
+                "open_interest": 100.0,
+                "volume": 50.0,
+                "mark_iv": 0.8
+            }
+        ]
+        self.analyzer.fetch_options_data("BTC")
+        
+        # Repeated calls return the same DataFrame
+        df = self.analyzer.create_options_dataframe()
+        self.assertIs(self.analyzer.create_options_dataframe(), df)
+        
+        # Fetching again invalidates the cached DataFrame
+        self.analyzer.fetch_options_data("BTC")
+        self.assertIsNot(self.analyzer.create_options_dataframe(), df)
+        
+        # So does assigning the data directly
+        df = self.analyzer.create_options_dataframe()
+        self.analyzer.data = dict(self.analyzer.data, index_price=40000.0)
+        self.assertIsNot(self.analyzer.create_options_dataframe(), df)
+    
+    def test_fetch_options_data_snapshot(self):
+        """Test that fetch_options_data reuses a recent snapshot from the cache directory."""
+        # Mock the client methods
+        self.client.get_index_price.return_value = {"index_price": 50000.0}
+        self.client.get_option_instruments_by_currency.return_value = [
+            {
+                "instrument_name": "BTC-31DEC21-60000-C",
+                "expiration_timestamp": 1640908800000,
+                "creation_timestamp": 1609459200000,
+                "strike": 60000.0
+            }
+        ]
+        self.client.get_option_summary_by_currency.return_value = [
+            {
+                "instrument_name": "BTC-31DEC21-60000-C",
+                "open_interest": 100.0,
+                "volume": 50.0,
+                "mark_iv": 0.8
+            }
+        ]
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # Fetch twice with the same cache directory
+            first = OptionsAnalyzer(self.client, cache_dir=cache_dir).fetch_options_data("BTC")
+            second = OptionsAnalyzer(self.client, cache_dir=cache_dir).fetch_options_data("BTC")
+        
+        # Check that the API was only called once and the data matches
+        self.client.get_option_summary_by_currency.assert_called_once_with("BTC")
+        self.assertEqual(first, second)
+    
+    def test_analyze_open_interest_by_strike_and_expiry_long_form(self):
+        """Test that open interest by strike and expiry is returned as column lists."""
+        # Set up test data
+        self.analyzer.data = {
+            "currency": "BTC",
+            "index_price": 50000.0,
+            "timestamp": datetime.now().isoformat(),
+            "options": [
+                {
+                    "instrument_name": "BTC-31DEC21-60000-C",
+                    "expiration_timestamp": 1640908800000,
+                    "creation_timestamp": 1609459200000,
+                    "strike": 60000.0,
+                    "open_interest": 100.0,
+                    "volume": 50.0,
+                    "mark_iv": 0.8
+                },
+                {
+                    "instrument_name": "BTC-31DEC21-40000-P",
+                    "expiration_timestamp": 1640908800000,
+                    "creation_timestamp": 1609459200000,
+                    "strike": 40000.0,
+                    "open_interest": 200.0,
+                    "volume": 75.0,
+                    "mark_iv": 0.7
+                }
+            ]
+        }
+        
+        # Call the method
+        result = self.analyzer.analyze_open_interest_by_strike_and_expiry()
+        
+        # Check the combined table, sorted by strike within the expiry
+        self.assertEqual(result["oi_by_expiry_strike"], {
+            "expiration_date": ["2021-12-31", "2021-12-31"],
+            "strike": [40000.0, 60000.0],
+            "open_interest": [200.0, 100.0]
+        })
+        
+        # Check the calls table only holds the call strike
+        self.assertEqual(result["calls_oi_by_expiry_strike"]["strike"], [60000.0])
+        self.assertEqual(result["puts_oi_by_expiry_strike"]["open_interest"], [200.0])
+    
+    def test_identify_volatility_skew_hotspots_skips_near_zero_mean_iv(self):
+        """Test that expirations with a near-zero mean IV produce no hotspots."""
+        # Set up test data: one expiration with near-zero IV, one with a skewed smile
+        options = []
+        for expiration_timestamp, ivs in [(1640908800000, [0.0, 1e-9]), (1648195200000, [0.5, 1.0])]:
+            for strike, iv in zip([40000.0, 60000.0], ivs):
+                options.append({
+                    "instrument_name": f"BTC-{expiration_timestamp}-{strike:.0f}-C",
+                    "expiration_timestamp": expiration_timestamp,
+                    "creation_timestamp": 1609459200000,
+                    "strike": strike,
+                    "open_interest": 100.0,
+                    "volume": 50.0,
+                    "mark_iv": iv
+                })
+        self.analyzer.data = {
+            "currency": "BTC",
+            "index_price": 50000.0,
+            "timestamp": datetime.now().isoformat(),
+            "options": options
+        }
+        
+        # Call the method
+        result = self.analyzer.identify_volatility_skew_hotspots(threshold_pct=20.0)
+        
+        # Check that only the skewed expiration is reported
+        self.assertEqual(result["summary"]["total_hotspots"], 2)
+        self.assertEqual({h["expiration_date"] for h in result["hotspots"]}, {"2022-03-25"})
+        self.assertAlmostEqual(result["summary"]["max_deviation"], 100 / 3)
+    
     def test_get_calls_and_puts(self):
         """Test the get_calls_and_puts method."""
         # Mock the create_options_dataframe method